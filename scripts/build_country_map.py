@@ -9,8 +9,6 @@ from pathlib import Path
 
 import yaml
 
-from rle.gee.map import create_country_map
-
 # Configuration
 IMAGES_DIR = Path("images")
 MAP_FILENAME = "country_map.png"
@@ -28,6 +26,10 @@ def check_map_exists() -> bool:
 
 def create_map_for_country(country_code):
     """Create a country map using gee-redlist-python."""
+    # Imported here so the common "map already exists" path doesn't pay for
+    # loading Earth Engine.
+    from rle.gee.map import create_country_map
+
     print(f"Creating country map: {map_path}")
     map_image = create_country_map(
         country_code=country_code,
@@ -14,6 +14,7 @@ write credentials. Existing COGs are skipped unless ``--force`` is passed.
 Usage:
     python scripts/rasterize_ecosystem_to_cog.py --project my-gcp-project
     python scripts/rasterize_ecosystem_to_cog.py --resolution 10 --force
+    python scripts/rasterize_ecosystem_to_cog.py --project my-gcp-project --dry-run
 """
 
 import argparse
@@ -72,10 +73,19 @@ def check_adc() -> None:
     gcsfs (``token='google_default'``) authenticates via Application Default
     Credentials, which are separate from ``gcloud auth login``. A 401/reauth
     error surfaces deep inside gcsfs as an unhelpful traceback, so we probe ADC
-    up front instead.
+    up front instead, minting a token in-process with google-auth (the same
+    library gcsfs uses) rather than spawning gcloud.
     """
-    result = _run(["gcloud", "auth", "application-default", "print-access-token"])
-    if result.returncode != 0:
+    import google.auth
+    from google.auth.exceptions import GoogleAuthError
+    from google.auth.transport.requests import Request
+
+    try:
+        credentials, _ = google.auth.default(
+            scopes=["https://www.googleapis.com/auth/cloud-platform"],
+        )
+        credentials.refresh(Request())
+    except GoogleAuthError:
         sys.exit(_REAUTH_HINT)
 
 
@@ -318,6 +328,12 @@ def main() -> None:
         "--force", action="store_true",
         help="Regenerate and re-upload even if the COG already exists",
     )
+    parser.add_argument(
+        "--dry-run", action="store_true",
+        help="Print the planned steps (API enable, bucket creation, public-read "
+             "grant, CORS, upload, config write) and exit without checking "
+             "credentials or changing anything",
+    )
     parser.add_argument(
         "--config", type=Path, default=CONFIG_PATH,
         help=f"Path to country config (default: {CONFIG_PATH})",
@@ -366,6 +382,41 @@ def main() -> None:
             f"beginning with 'goog' or containing 'google'.{hint}"
         )
 
+    # Credential-free config checks run before --dry-run returns, so a dry run
+    # catches the same misconfigurations as the real run.
+    # ecosystem_code_column is optional: fall back to the name column so the
+    # raster indices match the name-based enumeration used elsewhere.
+    ecosystem_column = source.get("ecosystem_code_column") or source.get("ecosystem_name_column")
+    if ecosystem_column is None:
+        sys.exit(
+            "ecosystem_source needs ecosystem_code_column or ecosystem_name_column "
+            "in config/country_config.yaml"
+        )
+
+    data = ensure_vector_source(source["data"])
+
+    if args.dry_run:
+        steps = []
+        if not args.force:
+            steps.append(f"If {gs_uri} already exists: re-apply CORS on "
+                         f"gs://{bucket}, record ecosystem_raster, and stop.")
+        steps += [
+            f"Enable storage.googleapis.com on project {args.project}.",
+            f"Create gs://{bucket} in {args.location} (uniform bucket-level "
+            "access) if it does not exist.",
+            f"Grant allUsers -> roles/storage.objectViewer on gs://{bucket} "
+            "(makes the bucket public).",
+            f"Apply the byte-range CORS policy to gs://{bucket}.",
+            f"Rasterize ecosystem_source.data at {resolution_m} m ({AOO_CRS}) "
+            f"and upload it to {gs_uri}.",
+            f"Record ecosystem_raster in {args.config}.",
+        ]
+        print("\nDry run - nothing was changed. Planned steps:")
+        for i, step in enumerate(steps, 1):
+            print(f"  {i}. {step}")
+        print(f"\nPublic URL: {cog_url}")
+        return
+
     # Verify credentials up front so a 401 fails with a clear hint rather than
     # a deep gcsfs traceback.
     check_adc()
@@ -390,17 +441,8 @@ def main() -> None:
     print(f"\nLoading ecosystem data from {source['data']}...")
     from rle.core import Ecosystems
 
-    # ecosystem_code_column is optional: fall back to the name column so the
-    # raster indices match the name-based enumeration used elsewhere.
-    ecosystem_column = source.get("ecosystem_code_column") or source.get("ecosystem_name_column")
-    if ecosystem_column is None:
-        sys.exit(
-            "ecosystem_source needs ecosystem_code_column or ecosystem_name_column "
-            "in config/country_config.yaml"
-        )
-
     eco = Ecosystems.from_file(
-        ensure_vector_source(source["data"]),
+        data,
         ecosystem_column=ecosystem_column,
         ecosystem_name_column=source.get("ecosystem_name_column"),
         functional_group_column=source.get("functional_group_column"),
@@ -4,12 +4,14 @@ import argparse
 import os
 import time
 
-import ee
-import google.auth
-
 
 def upload_default_country_asset(project: str) -> None:
     """Upload a 3-feature default country FeatureCollection."""
+    # Imported here so --help and argument errors don't pay for loading
+    # Earth Engine.
+    import ee
+    import google.auth
+
     asset_id = f"projects/{project}/assets/ruritania/ruritania_ecosystems"
 
     credentials, _ = google.auth.default(
@@ -25,12 +27,13 @@ def upload_default_country_asset(project: str) -> None:
     except ee.EEException:
         pass
 
-    # Create ruritania/ folder
+    # Create ruritania/ folder unless it already exists. Probing with a read
+    # skips the write on re-runs and lets real createAsset errors surface.
     folder_id = f"projects/{project}/assets/ruritania"
     try:
-        ee.data.createAsset({"type": "FOLDER"}, folder_id)
+        ee.data.getAsset(folder_id)
     except ee.EEException:
-        pass  # folder exists
+        ee.data.createAsset({"type": "FOLDER"}, folder_id)
 
     # Shared coordinate lists to avoid duplication and ensure polygons
     # tile together without gaps or overlaps.
@@ -158,10 +161,17 @@ def upload_default_country_asset(project: str) -> None:
     task.start()
     print("Uploading default country asset…")
 
-    while task.active():
-        time.sleep(2)
-
+    # Back off exponentially: small exports finish in seconds, but an export
+    # can sit queued for minutes and doesn't need polling every 2 s. One
+    # status() call per iteration serves both the loop test and the result
+    # (task.active() would fetch the status again).
+    delay = 2
     status = task.status()
+    while status["state"] in ("READY", "RUNNING", "CANCEL_REQUESTED"):
+        time.sleep(delay)
+        delay = min(delay * 1.5, 60)
+        status = task.status()
+
     if status["state"] == "COMPLETED":
         print(f"Done: {asset_id}")
     else:
@@ -1,12 +1,8 @@
 """Tests for build_caches URL derivation and comment-preserving config write-back."""
 
-import sys
-from pathlib import Path
-
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
-import build_caches as bc  # noqa: E402
+import build_caches as bc
 
 
 def test_derive_cache_urls_is_project_and_data_keyed():
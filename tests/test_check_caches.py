@@ -1,10 +1,6 @@
 """Tests for the ecosystem-cache readiness guard (scripts/check_caches.py)."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
-from check_caches import evaluate  # noqa: E402
+from check_caches import evaluate
 
 _GB = 1024 ** 3
 _MB = 1024 ** 2
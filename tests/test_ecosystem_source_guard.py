@@ -5,13 +5,9 @@ fails deep in geopandas/GDAL with a cryptic pyogrio error. `ensure_vector_source
 turns that into an early, actionable SystemExit.
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
-from _config import ensure_vector_source  # noqa: E402
+from _config import ensure_vector_source
 
 
 def test_raster_source_raises():
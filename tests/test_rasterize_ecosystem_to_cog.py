@@ -0,0 +1,85 @@
+"""Tests for rasterize_ecosystem_to_cog's credential-free code paths."""
+
+import sys
+
+import pytest
+
+import rasterize_ecosystem_to_cog as rc
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("must not be called during --dry-run")
+
+
+def test_dry_run_prints_plan_without_side_effects(tmp_path, monkeypatch, capsys):
+    cfg = tmp_path / "country_config.yaml"
+    cfg.write_text(
+        "ecosystem_source:\n"
+        "  data: https://h/map.parquet\n"
+        "  ecosystem_name_column: ecos_general\n"
+    )
+    before = cfg.read_text()
+    monkeypatch.setattr(rc, "check_adc", _fail)
+    monkeypatch.setattr(rc, "_run", _fail)
+    monkeypatch.setattr(sys, "argv", [
+        "rasterize_ecosystem_to_cog.py", "--project", "myproj",
+        "--config", str(cfg), "--dry-run",
+    ])
+
+    rc.main()
+
+    assert cfg.read_text() == before
+    out = capsys.readouterr().out
+    assert "gs://myproj-rle-cogs/ecosystems/map_100m.tif" in out
+    assert "roles/storage.objectViewer" in out
+    assert "storage.googleapis.com" in out
+
+
+def test_dry_run_rejects_raster_source(tmp_path, monkeypatch):
+    # The real run exits on a raster ecosystem_source.data; a dry run must too.
+    cfg = tmp_path / "country_config.yaml"
+    cfg.write_text(
+        "ecosystem_source:\n"
+        "  data: https://h/map.tif\n"
+        "  ecosystem_name_column: ecos_general\n"
+    )
+    monkeypatch.setattr(rc, "check_adc", _fail)
+    monkeypatch.setattr(rc, "_run", _fail)
+    monkeypatch.setattr(sys, "argv", [
+        "rasterize_ecosystem_to_cog.py", "--project", "myproj",
+        "--config", str(cfg), "--dry-run",
+    ])
+
+    with pytest.raises(SystemExit) as exc:
+        rc.main()
+    assert "ecosystem_raster.cog_url" in str(exc.value)
+
+
+# --- check_adc: any google-auth failure becomes the re-auth hint --------------
+
+def test_check_adc_exits_with_hint_when_adc_missing(monkeypatch):
+    import google.auth
+    from google.auth.exceptions import DefaultCredentialsError
+
+    def _no_adc(**kwargs):
+        raise DefaultCredentialsError("no ADC")
+
+    monkeypatch.setattr(google.auth, "default", _no_adc)
+    with pytest.raises(SystemExit) as exc:
+        rc.check_adc()
+    assert exc.value.code == rc._REAUTH_HINT
+
+
+def test_check_adc_exits_with_hint_when_refresh_fails(monkeypatch):
+    import google.auth
+    from google.auth.exceptions import RefreshError
+
+    class _ExpiredCredentials:
+        def refresh(self, request):
+            raise RefreshError("Reauthentication is needed.")
+
+    monkeypatch.setattr(
+        google.auth, "default", lambda **kwargs: (_ExpiredCredentials(), "proj"))
+    with pytest.raises(SystemExit) as exc:
+        rc.check_adc()
+    assert exc.value.code == rc._REAUTH_HINT